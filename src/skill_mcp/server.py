@@ -6,11 +6,13 @@ A Model Context Protocol server for managing Claude skills with per-skill enviro
 and automatic dependency management for Python scripts.
 """
 
-from typing import Any
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple, Type
 
 import mcp.server.stdio
 from mcp import types
 from mcp.server import Server
+from pydantic import BaseModel
 
 from skill_mcp.models import ExecutePythonCodeInput, RunSkillScriptInput
 from skill_mcp.models_crud import (
@@ -30,40 +32,39 @@ app = Server("skill-mcp")
 @app.list_tools()  # type: ignore[misc]
 async def list_tools() -> list[types.Tool]:
     """List available tools."""
-    tools = []
-    tools.extend(SkillCrud.get_tool_definition())
-    tools.extend(SkillFilesCrud.get_tool_definition())
-    tools.extend(SkillEnvCrud.get_tool_definition())
-    tools.extend(ScriptTools.get_script_tools())
-    return tools
+    return [
+        *SkillCrud.get_tool_definition(),
+        *SkillFilesCrud.get_tool_definition(),
+        *SkillEnvCrud.get_tool_definition(),
+        *ScriptTools.get_script_tools(),
+    ]
+
+
+# Tool name -> (input model, handler)
+_TOOL_HANDLERS: Dict[
+    str, Tuple[Type[BaseModel], Callable[[Any], Awaitable[list[types.TextContent]]]]
+] = {
+    # Unified CRUD tools
+    "skill_crud": (SkillCrudInput, SkillCrud.skill_crud),
+    "skill_files_crud": (SkillFilesCrudInput, SkillFilesCrud.skill_files_crud),
+    "skill_env_crud": (SkillEnvCrudInput, SkillEnvCrud.skill_env_crud),
+    # Script execution tools
+    "execute_python_code": (ExecutePythonCodeInput, ScriptTools.execute_python_code),
+    "run_skill_script": (RunSkillScriptInput, ScriptTools.run_skill_script),
+}
 
 
 @app.call_tool()  # type: ignore[misc]
 async def call_tool(name: str, arguments: Any) -> list[types.TextContent]:
     """Handle tool calls."""
     try:
-        # Unified CRUD tools
-        if name == "skill_crud":
-            skill_input = SkillCrudInput(**arguments)
-            return await SkillCrud.skill_crud(skill_input)
-        elif name == "skill_files_crud":
-            files_input = SkillFilesCrudInput(**arguments)
-            return await SkillFilesCrud.skill_files_crud(files_input)
-        elif name == "skill_env_crud":
-            env_input = SkillEnvCrudInput(**arguments)
-            return await SkillEnvCrud.skill_env_crud(env_input)
-
-        # Script execution tools
-        elif name == "execute_python_code":
-            code_input = ExecutePythonCodeInput(**arguments)
-            return await ScriptTools.execute_python_code(code_input)
-        elif name == "run_skill_script":
-            script_input = RunSkillScriptInput(**arguments)
-            return await ScriptTools.run_skill_script(script_input)
-
-        else:
+        entry = _TOOL_HANDLERS.get(name)
+        if entry is None:
             return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
 
+        input_model, handler = entry
+        return await handler(input_model(**arguments))
+
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
@@ -76,12 +77,8 @@ async def main() -> None:
 
 def run() -> None:
     """Entry point for the MCP server."""
-    import asyncio
-
     asyncio.run(main())
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
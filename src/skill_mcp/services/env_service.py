@@ -1,12 +1,24 @@
 """Environment variable management service."""
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 from dotenv import dotenv_values
 
 from skill_mcp.core.config import ENV_FILE_NAME, SKILLS_DIR
 from skill_mcp.core.exceptions import EnvFileError, SkillNotFoundError
+from skill_mcp.utils.file_cache import invalidate_file_caches, stat_cached
+
+
+def _env_pairs(values: Dict[str, Optional[str]]) -> Tuple[Tuple[str, str], ...]:
+    """Filter out None values from dotenv_values."""
+    return tuple((k, v) for k, v in values.items() if v is not None)
+
+
+@stat_cached(maxsize=256)
+def _parse_env_file(env_file: Path) -> Tuple[Tuple[str, str], ...]:
+    """Parse a .env file into key/value pairs, without ${VAR} interpolation."""
+    return _env_pairs(dotenv_values(env_file, interpolate=False))
 
 
 class EnvironmentService:
@@ -38,13 +50,20 @@ class EnvironmentService:
         if not skill_dir.exists():
             raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
 
+        return EnvironmentService._load_env_file(skill_name)
+
+    @staticmethod
+    def _load_env_file(skill_name: str) -> Dict[str, str]:
+        """Load the .env file of a skill already known to exist."""
         env_file = EnvironmentService.get_env_file_path(skill_name)
 
         try:
-            if env_file.exists():
-                # Filter out None values from dotenv_values
-                values = dotenv_values(env_file)
-                return {k: v for k, v in values.items() if v is not None}
+            pairs = _parse_env_file(env_file)
+            # ${VAR} references resolve against os.environ, which may have changed
+            if any("$" in value for _, value in pairs):
+                pairs = _env_pairs(dotenv_values(env_file))
+            return dict(pairs)
+        except FileNotFoundError:
             return {}
         except Exception as e:
             raise EnvFileError(f"Failed to load .env for skill '{skill_name}': {str(e)}")
@@ -96,12 +115,19 @@ class EnvironmentService:
         if not skill_dir.exists():
             raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
 
+        EnvironmentService._write_env_file(skill_name, content)
+
+    @staticmethod
+    def _write_env_file(skill_name: str, content: str) -> None:
+        """Write the .env file of a skill already known to exist."""
         env_file = EnvironmentService.get_env_file_path(skill_name)
 
         try:
             env_file.write_text(content)
         except Exception as e:
             raise EnvFileError(f"Failed to write .env for skill '{skill_name}': {str(e)}")
+        finally:
+            invalidate_file_caches()
 
     @staticmethod
     def get_env_keys(skill_name: str) -> list[str]:
@@ -140,12 +166,12 @@ class EnvironmentService:
             raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
 
         # Load existing vars and merge
-        existing_vars = EnvironmentService.load_skill_env(skill_name)
+        existing_vars = EnvironmentService._load_env_file(skill_name)
         existing_vars.update(variables)
 
         # Write back
         content = "\n".join(f"{key}={value}" for key, value in existing_vars.items())
-        EnvironmentService.update_env_file(skill_name, content)
+        EnvironmentService._write_env_file(skill_name, content)
 
     @staticmethod
     def delete_variables(skill_name: str, keys: list[str]) -> int:
@@ -169,7 +195,7 @@ class EnvironmentService:
             raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
 
         # Load existing vars
-        existing_vars = EnvironmentService.load_skill_env(skill_name)
+        existing_vars = EnvironmentService._load_env_file(skill_name)
 
         # Track how many were actually deleted
         deleted_count = 0
@@ -183,10 +209,10 @@ class EnvironmentService:
         # Write back
         if existing_vars:
             content = "\n".join(f"{key}={value}" for key, value in existing_vars.items())
-            EnvironmentService.update_env_file(skill_name, content)
+            EnvironmentService._write_env_file(skill_name, content)
         else:
             # Clear the file if no vars left
-            EnvironmentService.update_env_file(skill_name, "")
+            EnvironmentService._write_env_file(skill_name, "")
 
         return deleted_count
 
@@ -207,4 +233,4 @@ class EnvironmentService:
         if not skill_dir.exists():
             raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
 
-        EnvironmentService.update_env_file(skill_name, "")
+        EnvironmentService._write_env_file(skill_name, "")
@@ -1,6 +1,9 @@
 """File management service."""
 
-from typing import Any, Dict, List
+import os
+from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from typing import Any, Dict, Iterator, List
 
 from skill_mcp.core.config import MAX_FILE_SIZE, SKILL_METADATA_FILE, SKILLS_DIR
 from skill_mcp.core.exceptions import (
@@ -9,6 +12,7 @@ from skill_mcp.core.exceptions import (
     ProtectedFileError,
     SkillNotFoundError,
 )
+from skill_mcp.utils.file_cache import invalidate_file_caches
 from skill_mcp.utils.path_utils import validate_path
 
 
@@ -29,29 +33,74 @@ class FileService:
         Raises:
             SkillNotFoundError: If skill doesn't exist
         """
+        return list(FileService.iter_skill_files(skill_name))
+
+    @staticmethod
+    def iter_skill_files(skill_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all files in a skill directory recursively.
+
+        Files are yielded lazily, sorted by path, as the directory tree is walked.
+
+        Args:
+            skill_name: Name of the skill
+
+        Returns:
+            Iterator of file information dictionaries
+
+        Raises:
+            SkillNotFoundError: If skill doesn't exist
+        """
+        skill_dir = FileService._require_skill_dir(skill_name)
+        return FileService._walk_files(skill_dir, "")
+
+    @staticmethod
+    def _require_skill_dir(skill_name: str) -> Path:
+        """
+        Return a skill's directory, checking it exists with a single stat.
+
+        Args:
+            skill_name: Name of the skill
+
+        Returns:
+            Path to the skill directory
+
+        Raises:
+            SkillNotFoundError: If skill doesn't exist or is not a directory
+        """
         skill_dir = SKILLS_DIR / skill_name
 
-        if not skill_dir.exists():
+        try:
+            skill_stat = skill_dir.stat()
+        except OSError:
             raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
 
-        if not skill_dir.is_dir():
+        if not S_ISDIR(skill_stat.st_mode):
             raise SkillNotFoundError(f"'{skill_name}' is not a directory")
 
-        files = []
-        for item in sorted(skill_dir.rglob("*")):
-            if item.is_file():
-                rel_path = item.relative_to(skill_dir)
-                stat = item.stat()
-                files.append(
-                    {
-                        "path": str(rel_path),
-                        "size": stat.st_size,
-                        "type": "file",
-                        "modified": stat.st_mtime,
-                    }
-                )
-
-        return files
+        return skill_dir
+
+    @staticmethod
+    def _walk_files(directory: Path, prefix: str) -> Iterator[Dict[str, Any]]:
+        """Yield file information for a directory tree in sorted path order."""
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except PermissionError:
+            return
+
+        for entry in entries:
+            rel_path = os.path.join(prefix, entry.name) if prefix else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from FileService._walk_files(Path(entry.path), rel_path)
+            elif entry.is_file():
+                stat = entry.stat()
+                yield {
+                    "path": rel_path,
+                    "size": stat.st_size,
+                    "type": "file",
+                    "modified": stat.st_mtime,
+                }
 
     @staticmethod
     def read_file(skill_name: str, file_path: str) -> str:
@@ -72,13 +121,15 @@ class FileService:
         """
         full_path = validate_path(skill_name, file_path)
 
-        if not full_path.exists():
+        try:
+            file_stat = full_path.stat()
+        except OSError:
             raise FileNotFoundError(f"File '{file_path}' does not exist in skill '{skill_name}'")
 
-        if not full_path.is_file():
+        if not S_ISREG(file_stat.st_mode):
             raise FileNotFoundError(f"'{file_path}' is not a file")
 
-        file_size = full_path.stat().st_size
+        file_size = file_stat.st_size
         if file_size > MAX_FILE_SIZE:
             raise FileTooBigError(
                 f"File too large ({file_size / 1024:.1f} KB). "
@@ -103,12 +154,7 @@ class FileService:
             FileNotFoundError: If file already exists
         """
         # Check if skill exists first
-        skill_dir = SKILLS_DIR / skill_name
-        if not skill_dir.exists():
-            raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
-
-        if not skill_dir.is_dir():
-            raise SkillNotFoundError(f"'{skill_name}' is not a directory")
+        FileService._require_skill_dir(skill_name)
 
         full_path = validate_path(skill_name, file_path)
 
@@ -123,6 +169,7 @@ class FileService:
 
         # Write content
         full_path.write_text(content)
+        invalidate_file_caches()
 
     @staticmethod
     def update_file(skill_name: str, file_path: str, content: str) -> None:
@@ -140,25 +187,23 @@ class FileService:
             FileNotFoundError: If file doesn't exist
         """
         # Check if skill exists first
-        skill_dir = SKILLS_DIR / skill_name
-        if not skill_dir.exists():
-            raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
-
-        if not skill_dir.is_dir():
-            raise SkillNotFoundError(f"'{skill_name}' is not a directory")
+        FileService._require_skill_dir(skill_name)
 
         full_path = validate_path(skill_name, file_path)
 
-        if not full_path.exists():
+        try:
+            file_stat = full_path.stat()
+        except OSError:
             raise FileNotFoundError(
                 f"File '{file_path}' does not exist in skill '{skill_name}'. "
                 "Use create to create it."
             )
 
-        if not full_path.is_file():
+        if not S_ISREG(file_stat.st_mode):
             raise FileNotFoundError(f"'{file_path}' is not a file")
 
         full_path.write_text(content)
+        invalidate_file_caches()
 
     @staticmethod
     def delete_file(skill_name: str, file_path: str) -> None:
@@ -182,19 +227,17 @@ class FileService:
             )
 
         # Check if skill exists first
-        skill_dir = SKILLS_DIR / skill_name
-        if not skill_dir.exists():
-            raise SkillNotFoundError(f"Skill '{skill_name}' does not exist")
-
-        if not skill_dir.is_dir():
-            raise SkillNotFoundError(f"'{skill_name}' is not a directory")
+        FileService._require_skill_dir(skill_name)
 
         full_path = validate_path(skill_name, file_path)
 
-        if not full_path.exists():
+        try:
+            file_stat = full_path.stat()
+        except OSError:
             raise FileNotFoundError(f"File '{file_path}' does not exist in skill '{skill_name}'")
 
-        if not full_path.is_file():
+        if not S_ISREG(file_stat.st_mode):
             raise FileNotFoundError(f"'{file_path}' is not a file. Cannot delete directories.")
 
         full_path.unlink()
+        invalidate_file_caches()
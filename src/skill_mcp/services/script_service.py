@@ -1,11 +1,12 @@
 """Script execution service."""
 
+import asyncio
 import os
 import re
-import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from stat import S_ISREG
+from typing import Any, Dict, List, Optional, Tuple
 
 from skill_mcp.core.config import (
     DEFAULT_PYTHON_INTERPRETER,
@@ -15,8 +16,27 @@ from skill_mcp.core.config import (
 )
 from skill_mcp.core.exceptions import InvalidPathError, ScriptExecutionError, SkillNotFoundError
 from skill_mcp.services.env_service import EnvironmentService
+from skill_mcp.utils.file_cache import stat_cached
 from skill_mcp.utils.path_utils import validate_path
-from skill_mcp.utils.script_detector import has_npm_dependencies, has_uv_dependencies
+from skill_mcp.utils.script_detector import (
+    has_npm_dependencies,
+    has_pep723_marker,
+    has_uv_dependencies,
+)
+
+# PEP 723 inline script metadata patterns
+_PEP723_BLOCK_RE = re.compile(r"#\s*///\s*script\s*\n(.*?)#\s*///\s*$", re.MULTILINE | re.DOTALL)
+_DEPENDENCIES_RE = re.compile(r"dependencies\s*=\s*\[(.*?)\]", re.DOTALL)
+_DEPENDENCY_STRING_RE = re.compile(r'["\']([^"\']+)["\']')
+_DEPENDENCIES_BLOCK_RE = re.compile(r"#\s*dependencies\s*=\s*\[.*?#\s*\]", re.DOTALL)
+
+# Leading PEP 508 distribution name of a dependency specifier
+_PKG_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+# Characters that can only appear after the name (versions, extras, markers, URLs)
+_SPECIFIER_CHARS = frozenset("<>=!~[;@ \t")
+
+# Bytes read from a child's pipe per call while collecting output
+_READ_CHUNK_SIZE = 8192
 
 
 def extract_pep723_dependencies(content: str) -> List[str]:
@@ -29,28 +49,62 @@ def extract_pep723_dependencies(content: str) -> List[str]:
     Returns:
         List of dependency strings (e.g., ["requests>=2.31.0", "pandas"])
     """
-    # Match PEP 723 script block
-    pattern = r"#\s*///\s*script\s*\n(.*?)#\s*///\s*$"
-    match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
+    match = _PEP723_BLOCK_RE.search(content)
 
     if not match:
         return []
 
-    metadata_block = match.group(1)
+    return _parse_dependencies(match.group(1))
+
 
-    # Extract dependencies array
-    deps_pattern = r"dependencies\s*=\s*\[(.*?)\]"
-    deps_match = re.search(deps_pattern, metadata_block, re.DOTALL)
+def _parse_dependencies(metadata_block: str) -> List[str]:
+    """Extract the dependency strings from the body of a PEP 723 block."""
+    deps_match = _DEPENDENCIES_RE.search(metadata_block)
 
     if not deps_match:
         return []
 
-    deps_content = deps_match.group(1)
+    return _DEPENDENCY_STRING_RE.findall(deps_match.group(1))
+
+
+@stat_cached(maxsize=256)
+def _file_dependencies(file_path: Path) -> Tuple[str, ...]:
+    """Read and parse a file's PEP 723 dependencies."""
+    return tuple(extract_pep723_dependencies(file_path.read_text(encoding="utf-8")))
+
+
+def read_pep723_dependencies(file_path: Path) -> List[str]:
+    """
+    Extract PEP 723 dependencies from a file on disk.
+
+    Args:
+        file_path: Path to the Python file
 
-    # Extract individual dependency strings
-    dep_strings = re.findall(r'["\']([^"\']+)["\']', deps_content)
+    Returns:
+        List of dependency strings
+    """
+    return list(_file_dependencies(file_path))
 
-    return dep_strings
+
+def _read_reference_dependencies(file_path: Path) -> List[str]:
+    """Read PEP 723 dependencies of a referenced skill file, skipping unreadable files."""
+    if not file_path.is_file():
+        return []
+
+    try:
+        return read_pep723_dependencies(file_path)
+    except Exception:
+        # If we can't read or parse the file, just skip dependency extraction
+        return []
+
+
+def _package_name(dep: str) -> str:
+    """Return the package name of a dependency string (e.g. "requests>=2.31.0" -> "requests")."""
+    dep = dep.strip()
+    if _SPECIFIER_CHARS.isdisjoint(dep):
+        return dep
+    match = _PKG_NAME_RE.match(dep)
+    return match.group(0) if match else dep
 
 
 def merge_dependencies(code: str, additional_deps: List[str]) -> str:
@@ -70,42 +124,37 @@ def merge_dependencies(code: str, additional_deps: List[str]) -> str:
     if not additional_deps:
         return code
 
-    # Extract existing dependencies
-    existing_deps = extract_pep723_dependencies(code)
+    match = _PEP723_BLOCK_RE.search(code)
+    existing_deps = _parse_dependencies(match.group(1)) if match else []
+
+    # Every dependency is already declared
+    if existing_deps and set(additional_deps).issubset(existing_deps):
+        return code
 
     # Merge and deduplicate (keep order, prefer later versions)
     # Use dict to preserve order and handle duplicates
     dep_map: Dict[str, str] = {}
 
     for dep in existing_deps + additional_deps:
-        # Extract package name (before any version specifier)
-        pkg_name = re.split(r"[<>=!]", dep)[0].strip()
-        dep_map[pkg_name] = dep
+        dep_map[_package_name(dep)] = dep
 
     merged_deps = list(dep_map.values())
 
     if not merged_deps:
         return code
 
-    # Check if code already has PEP 723 metadata
-    pattern = r"#\s*///\s*script\s*\n(.*?)#\s*///\s*$"
-    match = re.search(pattern, code, re.MULTILINE | re.DOTALL)
-
     if match:
         # Replace existing dependencies
         metadata_block = match.group(1)
 
         # Format new dependencies with proper newlines
-        deps_lines = ["# dependencies = ["]
-        for dep in merged_deps:
-            deps_lines.append(f'#   "{dep}",')
-        deps_lines.append("# ]")
-        deps_str = "\n".join(deps_lines)
+        deps_str = (
+            "# dependencies = [\n" + "".join(f'#   "{dep}",\n' for dep in merged_deps) + "# ]"
+        )
 
         # Replace or add dependencies in metadata block
-        deps_pattern = r"#\s*dependencies\s*=\s*\[.*?#\s*\]"
-        if re.search(deps_pattern, metadata_block, re.DOTALL):
-            new_metadata = re.sub(deps_pattern, deps_str, metadata_block, flags=re.DOTALL)
+        if _DEPENDENCIES_BLOCK_RE.search(metadata_block):
+            new_metadata = _DEPENDENCIES_BLOCK_RE.sub(deps_str, metadata_block)
         else:
             # Add dependencies to metadata
             new_metadata = deps_str + "\n" + metadata_block
@@ -117,14 +166,8 @@ def merge_dependencies(code: str, additional_deps: List[str]) -> str:
         return new_code
     else:
         # Create new PEP 723 block at the beginning
-        deps_lines = ["# /// script", "# dependencies = ["]
-        for dep in merged_deps:
-            deps_lines.append(f'#   "{dep}",')
-        deps_lines.append("# ]")
-        deps_lines.append("# ///")
-        deps_lines.append("")
-        pep723_block = "\n".join(deps_lines)
-        return pep723_block + code
+        deps_body = "".join(f'#   "{dep}",\n' for dep in merged_deps)
+        return f"# /// script\n# dependencies = [\n{deps_body}# ]\n# ///\n{code}"
 
 
 class ScriptResult:
@@ -145,6 +188,99 @@ class ScriptResult:
         }
 
 
+async def _read_capped(stream: asyncio.StreamReader, limit: int) -> Tuple[bytes, bool]:
+    """
+    Read a pipe until EOF, keeping at most ``limit`` bytes.
+
+    Output beyond the limit is read and discarded so the child never blocks
+    on a full pipe.
+
+    Returns:
+        Tuple of (kept bytes, whether output was truncated)
+    """
+    buffer = bytearray()
+    truncated = False
+    while True:
+        chunk = await stream.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        room = limit - len(buffer)
+        if len(chunk) > room:
+            truncated = True
+            chunk = chunk[:room]
+        buffer += chunk
+    return bytes(buffer), truncated
+
+
+def _decode_output(data: bytes, truncated: bool) -> str:
+    """Decode captured process output, marking it if it was truncated."""
+    text = data.decode("utf-8", errors="replace")
+    if truncated:
+        return text + "\n... (output truncated)"
+    return text
+
+
+async def _run_process(
+    cmd: List[str],
+    env: Dict[str, str],
+    timeout: int,
+    cwd: Optional[str] = None,
+) -> ScriptResult:
+    """
+    Run a command, collecting at most MAX_OUTPUT_SIZE bytes of stdout and stderr.
+
+    Args:
+        cmd: Command and arguments to execute
+        env: Environment for the child process
+        timeout: Timeout in seconds
+        cwd: Optional working directory
+
+    Returns:
+        ScriptResult with the (possibly truncated) output
+
+    Raises:
+        asyncio.TimeoutError: If the process does not finish in time (it is killed)
+    """
+    # The server speaks JSON-RPC over its own stdin, so children must not inherit it
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        env=env,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    async def communicate() -> Tuple[Tuple[bytes, bool], Tuple[bytes, bool]]:
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout, stderr = await asyncio.gather(
+            _read_capped(proc.stdout, MAX_OUTPUT_SIZE),
+            _read_capped(proc.stderr, MAX_OUTPUT_SIZE),
+        )
+        await proc.wait()
+        return stdout, stderr
+
+    try:
+        (stdout, stdout_truncated), (stderr, stderr_truncated) = await asyncio.wait_for(
+            communicate(), timeout=timeout
+        )
+    finally:
+        # Timed out or cancelled: don't leave the child running
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+
+    assert proc.returncode is not None
+    return ScriptResult(
+        proc.returncode,
+        _decode_output(stdout, stdout_truncated),
+        _decode_output(stderr, stderr_truncated),
+    )
+
+
 class ScriptService:
     """Service for executing skill scripts."""
 
@@ -182,12 +318,14 @@ class ScriptService:
         except (InvalidPathError, Exception) as e:
             raise InvalidPathError(f"Invalid script path: {str(e)}")
 
-        if not full_script_path.exists():
+        try:
+            script_stat = full_script_path.stat()
+        except OSError:
             raise ScriptExecutionError(
                 f"Script '{script_path}' does not exist in skill '{skill_name}'"
             )
 
-        if not full_script_path.is_file():
+        if not S_ISREG(script_stat.st_mode):
             raise ScriptExecutionError(f"'{script_path}' is not a file")
 
         # Load skill environment variables
@@ -199,8 +337,7 @@ class ScriptService:
             skill_env = {}
 
         # Build environment
-        env = os.environ.copy()
-        env.update(skill_env)
+        env = {**os.environ, **skill_env}
 
         # Determine working directory
         if working_dir:
@@ -233,20 +370,18 @@ class ScriptService:
                 node_modules = full_script_path.parent / "node_modules"
                 if not node_modules.exists():
                     try:
-                        subprocess.run(
+                        install = await _run_process(
                             ["npm", "install"],
+                            env,
+                            script_timeout,
                             cwd=str(full_script_path.parent),
-                            env=env,
-                            capture_output=True,
-                            timeout=script_timeout,
-                            check=True,
                         )
-                    except subprocess.CalledProcessError as e:
-                        raise ScriptExecutionError(f"npm install failed: {e.stderr}")
-                    except subprocess.TimeoutExpired:
+                    except asyncio.TimeoutError:
                         raise ScriptExecutionError(
                             f"npm install timed out ({script_timeout} seconds)"
                         )
+                    if install.exit_code != 0:
+                        raise ScriptExecutionError(f"npm install failed: {install.stderr}")
             cmd = ["node", str(full_script_path)] + args
         elif ext == ".sh":
             cmd = ["bash", str(full_script_path)] + args
@@ -256,27 +391,9 @@ class ScriptService:
 
         # Execute script
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=work_dir,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=script_timeout,
-            )
-
-            # Truncate output if needed
-            stdout = result.stdout
-            if len(stdout) > MAX_OUTPUT_SIZE:
-                stdout = stdout[:MAX_OUTPUT_SIZE] + "\n... (output truncated)"
-
-            stderr = result.stderr
-            if len(stderr) > MAX_OUTPUT_SIZE:
-                stderr = stderr[:MAX_OUTPUT_SIZE] + "\n... (output truncated)"
-
-            return ScriptResult(result.returncode, stdout, stderr)
+            return await _run_process(cmd, env, script_timeout, cwd=work_dir)
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             raise ScriptExecutionError(f"Script execution timed out ({script_timeout} seconds)")
         except Exception as e:
             raise ScriptExecutionError(f"Failed to execute script: {str(e)}")
@@ -312,20 +429,20 @@ class ScriptService:
         temp_file = None
         try:
             # Parse skill references and collect dependencies
-            env = os.environ.copy()
+            skill_env: Dict[str, str] = {}
             python_paths: List[str] = []
             aggregated_deps: List[str] = []
             processed_skills: set[str] = set()  # Track which skills we've processed
+            ref_files: List[Path] = []
 
             if skill_references:
                 for ref in skill_references:
                     # Parse namespace format: skill_name:path/to/file.py
-                    if ":" not in ref:
+                    skill_name, sep, file_path = ref.partition(":")
+                    if not sep:
                         raise ScriptExecutionError(
                             f"Invalid skill reference format: '{ref}'. Expected 'skill_name:path/to/file.py'"
                         )
-
-                    skill_name, file_path = ref.split(":", 1)
                     skill_dir = SKILLS_DIR / skill_name
 
                     if not skill_dir.exists():
@@ -338,34 +455,30 @@ class ScriptService:
                     # Load environment variables from this skill (only once per skill)
                     if skill_name not in processed_skills:
                         try:
-                            skill_env = EnvironmentService.load_skill_env(skill_name)
-                            env.update(skill_env)
+                            skill_env.update(EnvironmentService.load_skill_env(skill_name))
                             processed_skills.add(skill_name)
                         except Exception:
                             # If we can't load env vars, just skip (skill may not have .env file)
                             processed_skills.add(skill_name)
 
-                    # Read the referenced file and extract its dependencies
-                    ref_file_path = skill_dir / file_path
-                    if ref_file_path.exists() and ref_file_path.is_file():
-                        try:
-                            ref_content = ref_file_path.read_text(encoding="utf-8")
-                            ref_deps = extract_pep723_dependencies(ref_content)
-                            aggregated_deps.extend(ref_deps)
-                        except Exception:
-                            # If we can't read or parse the file, just skip dependency extraction
-                            pass
+                    ref_files.append(skill_dir / file_path)
+
+            # Read the referenced files and extract their dependencies concurrently
+            if ref_files:
+                ref_deps = await asyncio.gather(
+                    *(asyncio.to_thread(_read_reference_dependencies, path) for path in ref_files)
+                )
+                for deps in ref_deps:
+                    aggregated_deps.extend(deps)
+                # Drop repeated dependencies, keeping first-seen order
+                aggregated_deps = list(dict.fromkeys(aggregated_deps))
 
             # Merge aggregated dependencies into the code
             if aggregated_deps:
                 code = merge_dependencies(code, aggregated_deps)
 
-            # Create temporary Python file with merged code
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".py", delete=False, encoding="utf-8"
-            ) as f:
-                f.write(code)
-                temp_file = Path(f.name)
+            # Build environment
+            env = {**os.environ, **skill_env}
 
             # Add paths to PYTHONPATH
             if python_paths:
@@ -373,8 +486,15 @@ class ScriptService:
                 new_paths = ":".join(python_paths)
                 env["PYTHONPATH"] = f"{new_paths}:{existing_path}" if existing_path else new_paths
 
+            # Create temporary Python file with merged code
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".py", delete=False, encoding="utf-8"
+            ) as f:
+                f.write(code)
+                temp_file = Path(f.name)
+
             # Check if code has PEP 723 dependencies (same logic as has_uv_dependencies)
-            has_deps = "# /// script" in code or "# /// pyproject" in code
+            has_deps = has_pep723_marker(code)
 
             # Build command
             if has_deps:
@@ -383,26 +503,9 @@ class ScriptService:
                 cmd = [DEFAULT_PYTHON_INTERPRETER, str(temp_file)]
 
             # Execute
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                env=env,
-                timeout=script_timeout,
-            )
-
-            # Truncate output if needed
-            stdout = result.stdout
-            if len(stdout) > MAX_OUTPUT_SIZE:
-                stdout = stdout[:MAX_OUTPUT_SIZE] + "\n... (output truncated)"
-
-            stderr = result.stderr
-            if len(stderr) > MAX_OUTPUT_SIZE:
-                stderr = stderr[:MAX_OUTPUT_SIZE] + "\n... (output truncated)"
-
-            return ScriptResult(result.returncode, stdout, stderr)
+            return await _run_process(cmd, env, script_timeout)
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             raise ScriptExecutionError(f"Code execution timed out ({script_timeout} seconds)")
         except (SkillNotFoundError, ScriptExecutionError):
             raise
@@ -1,18 +1,29 @@
 """Skill management service."""
 
+import os
+from pathlib import Path
+
 from skill_mcp.core.config import SKILL_METADATA_FILE, SKILLS_DIR
 from skill_mcp.core.exceptions import SkillNotFoundError
 from skill_mcp.models import FileInfo, ScriptInfo, SkillDetails, SkillMetadata, SkillSummary
 from skill_mcp.services.env_service import EnvironmentService
 from skill_mcp.services.file_service import FileService
+from skill_mcp.utils.file_cache import stat_cached
 from skill_mcp.utils.script_detector import get_file_type, has_uv_dependencies, is_executable_script
 from skill_mcp.utils.yaml_parser import (
     get_skill_description,
     get_skill_name,
     parse_yaml_frontmatter,
+    read_yaml_frontmatter,
 )
 
 
+@stat_cached(maxsize=1024)
+def _read_skill_description(skill_md_path: Path) -> str:
+    """Read the description from a SKILL.md's frontmatter."""
+    return get_skill_description(read_yaml_frontmatter(skill_md_path))
+
+
 class SkillService:
     """Service for managing skills."""
 
@@ -29,33 +40,29 @@ class SkillService:
         if not SKILLS_DIR.exists():
             return skills
 
-        for item in sorted(SKILLS_DIR.iterdir()):
-            if item.is_dir():
-                skill_summary = SkillService._get_skill_summary(item.name)
-                if skill_summary:
-                    skills.append(skill_summary)
+        with os.scandir(SKILLS_DIR) as it:
+            skill_names = sorted(entry.name for entry in it if entry.is_dir())
+
+        for skill_name in skill_names:
+            skills.append(SkillService._get_skill_summary(skill_name))
 
         return skills
 
     @staticmethod
-    def _get_skill_summary(skill_name: str) -> SkillSummary | None:
-        """Get a summary of a single skill."""
+    def _get_skill_summary(skill_name: str) -> SkillSummary:
+        """Get a summary of a single skill whose directory is known to exist."""
         skill_dir = SKILLS_DIR / skill_name
-
-        if not skill_dir.is_dir():
-            return None
-
         skill_md_path = skill_dir / SKILL_METADATA_FILE
-        has_skill_md = skill_md_path.exists()
 
-        description = ""
-        if has_skill_md:
-            try:
-                content = skill_md_path.read_text()
-                metadata = parse_yaml_frontmatter(content)
-                description = get_skill_description(metadata)
-            except Exception:
-                pass
+        has_skill_md = True
+        try:
+            description = _read_skill_description(skill_md_path)
+        except FileNotFoundError:
+            has_skill_md = False
+            description = ""
+        except Exception:
+            # Failures are not cached, so an unreadable SKILL.md is retried next listing
+            description = ""
 
         return SkillSummary(
             name=skill_name,
@@ -103,12 +110,11 @@ class SkillService:
             except Exception:
                 pass
 
-        # List all files
-        files_list = FileService.list_skill_files(skill_name)
+        # Walk all files
         files: list[FileInfo] = []
         scripts: list[ScriptInfo] = []
 
-        for file_info in files_list:
+        for file_info in FileService.iter_skill_files(skill_name):
             file_path = skill_dir / file_info["path"]
             file_type = get_file_type(file_path)
             is_exec = is_executable_script(file_path)
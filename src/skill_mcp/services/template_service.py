@@ -1,12 +1,13 @@
 """Template management service."""
 
 from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 
 from skill_mcp.core.exceptions import InvalidTemplateError
 
 
-@dataclass
+@dataclass(frozen=True)
 class TemplateSpec:
     """Specification for a skill template."""
 
@@ -48,15 +49,19 @@ class TemplateRegistry:
         ),
     }
 
+    # Read-only view of the registry and its names
+    _TEMPLATES_VIEW: Mapping[str, TemplateSpec] = MappingProxyType(TEMPLATES)
+    _AVAILABLE_NAMES = ", ".join(TEMPLATES)
+
     @staticmethod
-    def list_templates() -> Dict[str, TemplateSpec]:
+    def list_templates() -> Mapping[str, TemplateSpec]:
         """
         List all available templates.
 
         Returns:
-            Dictionary mapping template names to TemplateSpec objects
+            Read-only mapping of template names to TemplateSpec objects
         """
-        return TemplateRegistry.TEMPLATES.copy()
+        return TemplateRegistry._TEMPLATES_VIEW
 
     @staticmethod
     def get_template(template_name: str) -> TemplateSpec:
@@ -73,9 +78,9 @@ class TemplateRegistry:
             InvalidTemplateError: If template doesn't exist
         """
         if template_name not in TemplateRegistry.TEMPLATES:
-            available = ", ".join(TemplateRegistry.TEMPLATES.keys())
             raise InvalidTemplateError(
-                f"Invalid template '{template_name}'. Available templates: {available}"
+                f"Invalid template '{template_name}'. "
+                f"Available templates: {TemplateRegistry._AVAILABLE_NAMES}"
             )
         return TemplateRegistry.TEMPLATES[template_name]
 
@@ -1,22 +1,32 @@
 """Script execution tools for MCP server."""
 
+from functools import lru_cache
+from typing import Tuple
+
 from mcp import types
 
 from skill_mcp.core.exceptions import SkillMCPException
 from skill_mcp.models import ExecutePythonCodeInput, RunSkillScriptInput
-from skill_mcp.services.script_service import ScriptService
+from skill_mcp.services.script_service import ScriptResult, ScriptService
 
 
-class ScriptTools:
-    """Tools for script execution."""
+def _format_result(header: str, result: ScriptResult) -> str:
+    """Render a script result as text."""
+    parts = [header, f"Exit code: {result.exit_code}\n\n"]
 
-    @staticmethod
-    def get_script_tools() -> list[types.Tool]:
-        """Get script execution tools."""
-        return [
-            types.Tool(
-                name="execute_python_code",
-                description="""Execute Python code directly without requiring a script file.
+    if result.stdout:
+        parts.append(f"STDOUT:\n{result.stdout}\n")
+
+    if result.stderr:
+        parts.append(f"STDERR:\n{result.stderr}\n")
+
+    if not result.stdout and not result.stderr:
+        parts.append("(No output)\n")
+
+    return "".join(parts)
+
+
+_EXECUTE_PYTHON_CODE_DESCRIPTION = """Execute Python code directly without requiring a script file.
 
 RECOMMENDATION: Prefer Python over bash/shell scripts for better portability, error handling, and maintainability.
 
@@ -123,12 +133,9 @@ WHY PYTHON OVER BASH/JS:
 RETURNS: Execution result with:
 - Exit code (0 = success, non-zero = failure)
 - STDOUT (standard output)
-- STDERR (error output)""",
-                inputSchema=ExecutePythonCodeInput.model_json_schema(),
-            ),
-            types.Tool(
-                name="run_skill_script",
-                description="""Execute a script within a skill directory. Skills are modular libraries with reusable code - scripts can import from their own modules or use external dependencies.
+- STDERR (error output)"""
+
+_RUN_SKILL_SCRIPT_DESCRIPTION = """Execute a script within a skill directory. Skills are modular libraries with reusable code - scripts can import from their own modules or use external dependencies.
 
 IMPORTANT: ALWAYS use this tool to execute scripts. DO NOT use external bash/shell tools to execute scripts directly. This tool provides:
 - Automatic dependency management (Python PEP 723, npm packages)
@@ -230,10 +237,33 @@ IMPORTANT PATH NOTES:
 RETURNS: Script execution result with:
 - Exit code (0 = success, non-zero = failure)
 - STDOUT (standard output)
-- STDERR (error output)""",
-                inputSchema=RunSkillScriptInput.model_json_schema(),
-            ),
-        ]
+- STDERR (error output)"""
+
+
+@lru_cache(maxsize=1)
+def _tool_definitions() -> Tuple[types.Tool, ...]:
+    """Build the script execution tool definitions."""
+    return (
+        types.Tool(
+            name="execute_python_code",
+            description=_EXECUTE_PYTHON_CODE_DESCRIPTION,
+            inputSchema=ExecutePythonCodeInput.model_json_schema(),
+        ),
+        types.Tool(
+            name="run_skill_script",
+            description=_RUN_SKILL_SCRIPT_DESCRIPTION,
+            inputSchema=RunSkillScriptInput.model_json_schema(),
+        ),
+    )
+
+
+class ScriptTools:
+    """Tools for script execution."""
+
+    @staticmethod
+    def get_script_tools() -> list[types.Tool]:
+        """Get script execution tools."""
+        return list(_tool_definitions())
 
     @staticmethod
     async def execute_python_code(
@@ -247,17 +277,7 @@ RETURNS: Script execution result with:
                 input_data.timeout,
             )
 
-            output = "Python Code Execution\n"
-            output += f"Exit code: {result.exit_code}\n\n"
-
-            if result.stdout:
-                output += f"STDOUT:\n{result.stdout}\n"
-
-            if result.stderr:
-                output += f"STDERR:\n{result.stderr}\n"
-
-            if not result.stdout and not result.stderr:
-                output += "(No output)\n"
+            output = _format_result("Python Code Execution\n", result)
 
             return [types.TextContent(type="text", text=output)]
         except SkillMCPException as e:
@@ -277,17 +297,9 @@ RETURNS: Script execution result with:
                 input_data.timeout,
             )
 
-            output = f"Script: {input_data.skill_name}/{input_data.script_path}\n"
-            output += f"Exit code: {result.exit_code}\n\n"
-
-            if result.stdout:
-                output += f"STDOUT:\n{result.stdout}\n"
-
-            if result.stderr:
-                output += f"STDERR:\n{result.stderr}\n"
-
-            if not result.stdout and not result.stderr:
-                output += "(No output)\n"
+            output = _format_result(
+                f"Script: {input_data.skill_name}/{input_data.script_path}\n", result
+            )
 
             return [types.TextContent(type="text", text=output)]
         except SkillMCPException as e:
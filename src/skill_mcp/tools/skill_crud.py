@@ -1,27 +1,28 @@
 """Unified skill CRUD tool for MCP server."""
 
+import asyncio
+import re
+import shutil
+from datetime import datetime
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Tuple
+
 from mcp import types
 
+from skill_mcp.core.config import SKILL_METADATA_FILE, SKILLS_DIR
 from skill_mcp.core.exceptions import (
     InvalidTemplateError,
     SkillAlreadyExistsError,
     SkillNotFoundError,
 )
+from skill_mcp.models import SkillSummary
 from skill_mcp.models_crud import SkillCrudInput
 from skill_mcp.services.skill_service import SkillService
 from skill_mcp.services.template_service import TemplateRegistry
+from skill_mcp.utils.file_cache import invalidate_file_caches
+from skill_mcp.utils.yaml_parser import get_skill_description, read_yaml_frontmatter
 
-
-class SkillCrud:
-    """Unified tool for skill CRUD operations."""
-
-    @staticmethod
-    def get_tool_definition() -> list[types.Tool]:
-        """Get tool definition."""
-        return [
-            types.Tool(
-                name="skill_crud",
-                description="""Unified CRUD tool for skill management.
+_SKILL_CRUD_DESCRIPTION = """Unified CRUD tool for skill management.
 
 IMPORTANT NOTES:
 - Skills are stored in ~/.skill-mcp/skills directory
@@ -62,10 +63,77 @@ IMPORTANT NOTES:
 
 // Delete skill
 {"operation": "delete", "skill_name": "my-skill", "confirm": true}
-```""",
-                inputSchema=SkillCrudInput.model_json_schema(),
-            )
-        ]
+```"""
+
+
+def _filter_skills(skills: List[SkillSummary], search: str) -> List[SkillSummary]:
+    """
+    Filter skills by a case-insensitive substring, or a regex on the name.
+
+    Patterns starting with '^' or containing '*' are also tried as regular
+    expressions against skill names.
+
+    Args:
+        skills: Skills to filter
+        search: Search text or pattern
+
+    Returns:
+        Skills matching the search, in their original order
+    """
+    needle = search.lower()
+    use_regex = search.startswith("^") or "*" in search
+
+    return [
+        s
+        for s in skills
+        if (
+            needle in s.name.lower()
+            or needle in (s.description or "").lower()
+            or (use_regex and re.search(search, s.name, re.IGNORECASE) is not None)
+        )
+    ]
+
+
+def _render_skills(header: str, skills: List[SkillSummary]) -> str:
+    """
+    Render a skill listing for the list and search operations.
+
+    Args:
+        header: Text placed before the entries
+        skills: Skills to render, in display order
+
+    Returns:
+        The header followed by one entry per skill
+    """
+    parts = [header]
+    for skill in skills:
+        status = "✓" if skill.has_skill_md else "✗"
+        if skill.description:
+            parts.append(f"{status} {skill.name}\n   Description: {skill.description}\n\n")
+        else:
+            parts.append(f"{status} {skill.name}\n\n")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1)
+def _tool_definitions() -> Tuple[types.Tool, ...]:
+    """Build the skill_crud tool definition."""
+    return (
+        types.Tool(
+            name="skill_crud",
+            description=_SKILL_CRUD_DESCRIPTION,
+            inputSchema=SkillCrudInput.model_json_schema(),
+        ),
+    )
+
+
+class SkillCrud:
+    """Unified tool for skill CRUD operations."""
+
+    @staticmethod
+    def get_tool_definition() -> list[types.Tool]:
+        """Get tool definition."""
+        return list(_tool_definitions())
 
     @staticmethod
     async def skill_crud(input_data: SkillCrudInput) -> list[types.TextContent]:
@@ -73,70 +141,33 @@ IMPORTANT NOTES:
         operation = input_data.operation
 
         try:
-            if operation == "list":
-                return await SkillCrud._handle_list(input_data)
-            elif operation == "search":
-                return await SkillCrud._handle_search(input_data)
-            elif operation == "get":
-                return await SkillCrud._handle_get(input_data)
-            elif operation == "validate":
-                return await SkillCrud._handle_validate(input_data)
-            elif operation == "delete":
-                return await SkillCrud._handle_delete(input_data)
-            elif operation == "create":
-                return await SkillCrud._handle_create(input_data)
-            elif operation == "list_templates":
-                return await SkillCrud._handle_list_templates(input_data)
-            else:
+            handler = _OPERATIONS.get(operation)
+            if handler is None:
                 return [
                     types.TextContent(
                         type="text",
-                        text=f"Unknown operation: {operation}. Valid operations: create, list, search, get, validate, delete, list_templates",
+                        text=f"Unknown operation: {operation}. Valid operations: {_VALID_OPERATIONS}",
                     )
                 ]
+            return await handler(input_data)
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
     @staticmethod
     async def _handle_list(input_data: SkillCrudInput) -> list[types.TextContent]:
         """Handle list operation."""
-        all_skills = SkillService.list_skills()
+        all_skills = await asyncio.to_thread(SkillService.list_skills)
 
         # Apply search filter if provided
         skills = all_skills
         if input_data.search:
-            import re
-
-            skills = [
-                s
-                for s in all_skills
-                if (
-                    input_data.search.lower() in s.name.lower()
-                    or input_data.search.lower() in (s.description or "").lower()
-                    or (
-                        re.search(input_data.search, s.name, re.IGNORECASE)
-                        if input_data.search.startswith("^") or "*" in input_data.search
-                        else False
-                    )
-                )
-            ]
+            skills = _filter_skills(all_skills, input_data.search)
 
+        matching = f" matching '{input_data.search}'" if input_data.search else ""
         if not skills:
-            result = "No skills found in ~/.skill-mcp/skills"
-            if input_data.search:
-                result += f" matching '{input_data.search}'"
+            result = f"No skills found in ~/.skill-mcp/skills{matching}"
         else:
-            result = f"Found {len(skills)} skill(s)"
-            if input_data.search:
-                result += f" matching '{input_data.search}'"
-            result += ":\n\n"
-
-            for skill in skills:
-                status = "✓" if skill.has_skill_md else "✗"
-                result += f"{status} {skill.name}\n"
-                if skill.description:
-                    result += f"   Description: {skill.description}\n"
-                result += "\n"
+            result = _render_skills(f"Found {len(skills)} skill(s){matching}:\n\n", skills)
 
         return [types.TextContent(type="text", text=result)]
 
@@ -150,36 +181,17 @@ IMPORTANT NOTES:
                 )
             ]
 
-        all_skills = SkillService.list_skills()
+        all_skills = await asyncio.to_thread(SkillService.list_skills)
 
         # Apply search filter
-        import re
-
-        skills = [
-            s
-            for s in all_skills
-            if (
-                input_data.search.lower() in s.name.lower()
-                or input_data.search.lower() in (s.description or "").lower()
-                or (
-                    re.search(input_data.search, s.name, re.IGNORECASE)
-                    if input_data.search.startswith("^") or "*" in input_data.search
-                    else False
-                )
-            )
-        ]
+        skills = _filter_skills(all_skills, input_data.search)
 
         if not skills:
             result = f"No skills found matching '{input_data.search}'"
         else:
-            result = f"Found {len(skills)} skill(s) matching '{input_data.search}':\n\n"
-
-            for skill in skills:
-                status = "✓" if skill.has_skill_md else "✗"
-                result += f"{status} {skill.name}\n"
-                if skill.description:
-                    result += f"   Description: {skill.description}\n"
-                result += "\n"
+            result = _render_skills(
+                f"Found {len(skills)} skill(s) matching '{input_data.search}':\n\n", skills
+            )
 
         return [types.TextContent(type="text", text=result)]
 
@@ -193,59 +205,58 @@ IMPORTANT NOTES:
                 )
             ]
 
-        details = SkillService.get_skill_details(input_data.skill_name)
+        details = await asyncio.to_thread(SkillService.get_skill_details, input_data.skill_name)
 
-        result = f"Skill: {details.name}\n"
-        result += f"Description: {details.description or 'N/A'}\n\n"
+        parts = [
+            f"Skill: {details.name}\n",
+            f"Description: {details.description or 'N/A'}\n\n",
+        ]
 
         # SKILL.md content
         if input_data.include_content and details.skill_md_content:
-            result += "=== SKILL.md Content ===\n"
-            result += details.skill_md_content
-            result += "\n\n"
+            parts.append("=== SKILL.md Content ===\n")
+            parts.append(details.skill_md_content)
+            parts.append("\n\n")
 
         # Files
-        result += f"Files ({len(details.files)}):\n"
+        parts.append(f"Files ({len(details.files)}):\n")
         for file in details.files:
             # Format modification time
             modified_str = ""
             if file.modified:
-                from datetime import datetime
-
                 modified_dt = datetime.fromtimestamp(file.modified)
                 modified_str = f", modified: {modified_dt.strftime('%Y-%m-%d')}"
 
             # Use namespaced path format
             namespaced_path = f"{details.name}:{file.path}"
-            result += f"  - {namespaced_path} ({file.size} bytes{modified_str})"
+            parts.append(f"  - {namespaced_path} ({file.size} bytes{modified_str})")
             if file.is_executable:
-                result += " [executable]"
+                parts.append(" [executable]")
                 if file.has_uv_deps is not None:
-                    result += f" [uv deps: {'yes' if file.has_uv_deps else 'no'}]"
-            result += "\n"
+                    parts.append(f" [uv deps: {'yes' if file.has_uv_deps else 'no'}]")
+            parts.append("\n")
 
         # Scripts
         if details.scripts:
-            result += f"\nScripts ({len(details.scripts)}):\n"
+            parts.append(f"\nScripts ({len(details.scripts)}):\n")
             for script in details.scripts:
                 # Use namespaced path format
                 namespaced_path = f"{details.name}:{script.path}"
-                result += f"  - {namespaced_path} ({script.type})"
+                parts.append(f"  - {namespaced_path} ({script.type})")
                 if script.has_uv_deps:
-                    result += " [has uv dependencies]"
-                result += "\n"
+                    parts.append(" [has uv dependencies]")
+                parts.append("\n")
 
         # Environment variables
-        result += "\nEnvironment Variables:\n"
+        parts.append("\nEnvironment Variables:\n")
         if details.env_vars:
-            for var in details.env_vars:
-                result += f"  - {var}\n"
+            parts.extend(f"  - {var}\n" for var in details.env_vars)
         else:
-            result += "  (none)\n"
+            parts.append("  (none)\n")
 
-        result += f"\n.env file exists: {'Yes' if details.has_env_file else 'No'}\n"
+        parts.append(f"\n.env file exists: {'Yes' if details.has_env_file else 'No'}\n")
 
-        return [types.TextContent(type="text", text=result)]
+        return [types.TextContent(type="text", text="".join(parts))]
 
     @staticmethod
     async def _handle_validate(input_data: SkillCrudInput) -> list[types.TextContent]:
@@ -258,8 +269,6 @@ IMPORTANT NOTES:
             ]
 
         # Simple validation: check if skill exists and has SKILL.md
-        from skill_mcp.core.config import SKILL_METADATA_FILE, SKILLS_DIR
-
         skill_dir = SKILLS_DIR / input_data.skill_name
         if not skill_dir.exists():
             raise SkillNotFoundError(f"Skill '{input_data.skill_name}' does not exist")
@@ -274,13 +283,7 @@ IMPORTANT NOTES:
         else:
             # Try to parse YAML frontmatter
             try:
-                from skill_mcp.utils.yaml_parser import (
-                    get_skill_description,
-                    parse_yaml_frontmatter,
-                )
-
-                content = skill_md.read_text()
-                metadata = parse_yaml_frontmatter(content)
+                metadata = read_yaml_frontmatter(skill_md)
                 if not metadata:
                     warnings.append("SKILL.md has no YAML frontmatter")
                 elif not get_skill_description(metadata):
@@ -290,23 +293,23 @@ IMPORTANT NOTES:
 
         is_valid = len(errors) == 0
 
-        result = f"Validation for skill '{input_data.skill_name}':\n"
-        result += f"Status: {'✓ Valid' if is_valid else '✗ Invalid'}\n\n"
+        parts = [
+            f"Validation for skill '{input_data.skill_name}':\n",
+            f"Status: {'✓ Valid' if is_valid else '✗ Invalid'}\n\n",
+        ]
 
         if errors:
-            result += "Errors:\n"
-            for error in errors:
-                result += f"  - {error}\n"
+            parts.append("Errors:\n")
+            parts.extend(f"  - {error}\n" for error in errors)
 
         if warnings:
-            result += "\nWarnings:\n"
-            for warning in warnings:
-                result += f"  - {warning}\n"
+            parts.append("\nWarnings:\n")
+            parts.extend(f"  - {warning}\n" for warning in warnings)
 
         if is_valid:
-            result += "\nSkill is valid and ready to use."
+            parts.append("\nSkill is valid and ready to use.")
 
-        return [types.TextContent(type="text", text=result)]
+        return [types.TextContent(type="text", text="".join(parts))]
 
     @staticmethod
     async def _handle_delete(input_data: SkillCrudInput) -> list[types.TextContent]:
@@ -327,10 +330,6 @@ IMPORTANT NOTES:
             ]
 
         # Delete skill directory
-        import shutil
-
-        from skill_mcp.core.config import SKILLS_DIR
-
         skill_dir = SKILLS_DIR / input_data.skill_name
         if not skill_dir.exists():
             raise SkillNotFoundError(f"Skill '{input_data.skill_name}' does not exist")
@@ -350,17 +349,19 @@ IMPORTANT NOTES:
         """Handle list_templates operation."""
         templates = TemplateRegistry.list_templates()
 
-        result = f"Available templates ({len(templates)}):\n\n"
+        parts = [f"Available templates ({len(templates)}):\n\n"]
 
         for name, spec in templates.items():
-            result += f"**{name}**\n"
-            result += f"  Description: {spec.description}\n"
-            result += f"  Files: {', '.join(spec.files)}\n\n"
+            parts.append(
+                f"**{name}**\n"
+                f"  Description: {spec.description}\n"
+                f"  Files: {', '.join(spec.files)}\n\n"
+            )
 
-        result += "Use template name in 'create' operation:\n"
-        result += '  {"operation": "create", "skill_name": "my-skill", "template": "python"}'
+        parts.append("Use template name in 'create' operation:\n")
+        parts.append('  {"operation": "create", "skill_name": "my-skill", "template": "python"}')
 
-        return [types.TextContent(type="text", text=result)]
+        return [types.TextContent(type="text", text="".join(parts))]
 
     @staticmethod
     async def _handle_create(input_data: SkillCrudInput) -> list[types.TextContent]:
@@ -380,8 +381,6 @@ IMPORTANT NOTES:
             return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
         # Create skill directory with SKILL.md
-        from skill_mcp.core.config import SKILL_METADATA_FILE, SKILLS_DIR
-
         skill_dir = SKILLS_DIR / input_data.skill_name
         if skill_dir.exists():
             raise SkillAlreadyExistsError(f"Skill '{input_data.skill_name}' already exists")
@@ -460,6 +459,8 @@ console.log("Hello from {skill_name}!");
             package_json_path.write_text(package_json_content)
             files_created.append("package.json")
 
+        invalidate_file_caches()
+
         return [
             types.TextContent(
                 type="text",
@@ -467,3 +468,17 @@ console.log("Hello from {skill_name}!");
                 + "\n".join(f"  - {f}" for f in files_created),
             )
         ]
+
+
+# Operation name -> handler
+_OPERATIONS: Dict[str, Callable[[SkillCrudInput], Awaitable[list[types.TextContent]]]] = {
+    "create": SkillCrud._handle_create,
+    "list": SkillCrud._handle_list,
+    "search": SkillCrud._handle_search,
+    "get": SkillCrud._handle_get,
+    "validate": SkillCrud._handle_validate,
+    "delete": SkillCrud._handle_delete,
+    "list_templates": SkillCrud._handle_list_templates,
+}
+
+_VALID_OPERATIONS = ", ".join(_OPERATIONS)
@@ -1,21 +1,14 @@
 """Unified environment variable CRUD tool for MCP server."""
 
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Tuple
+
 from mcp import types
 
 from skill_mcp.models_crud import SkillEnvCrudInput
 from skill_mcp.services.env_service import EnvironmentService
 
-
-class SkillEnvCrud:
-    """Unified tool for skill environment variable CRUD operations."""
-
-    @staticmethod
-    def get_tool_definition() -> list[types.Tool]:
-        """Get tool definition."""
-        return [
-            types.Tool(
-                name="skill_env_crud",
-                description="""Unified CRUD tool for skill environment variable operations. Supports single and bulk operations.
+_SKILL_ENV_CRUD_DESCRIPTION = """Unified CRUD tool for skill environment variable operations. Supports single and bulk operations.
 
 **Operations:**
 - **read**: Read all environment variable keys (values are hidden for security)
@@ -70,10 +63,28 @@ class SkillEnvCrud:
 }
 ```
 
-**Note:** The 'set' operation always merges with existing variables. To replace everything, use 'clear' first, then 'set'.""",
-                inputSchema=SkillEnvCrudInput.model_json_schema(),
-            )
-        ]
+**Note:** The 'set' operation always merges with existing variables. To replace everything, use 'clear' first, then 'set'."""
+
+
+@lru_cache(maxsize=1)
+def _tool_definitions() -> Tuple[types.Tool, ...]:
+    """Build the skill_env_crud tool definition."""
+    return (
+        types.Tool(
+            name="skill_env_crud",
+            description=_SKILL_ENV_CRUD_DESCRIPTION,
+            inputSchema=SkillEnvCrudInput.model_json_schema(),
+        ),
+    )
+
+
+class SkillEnvCrud:
+    """Unified tool for skill environment variable CRUD operations."""
+
+    @staticmethod
+    def get_tool_definition() -> list[types.Tool]:
+        """Get tool definition."""
+        return list(_tool_definitions())
 
     @staticmethod
     async def skill_env_crud(input_data: SkillEnvCrudInput) -> list[types.TextContent]:
@@ -81,21 +92,15 @@ class SkillEnvCrud:
         operation = input_data.operation
 
         try:
-            if operation == "read":
-                return await SkillEnvCrud._handle_read(input_data)
-            elif operation == "set":
-                return await SkillEnvCrud._handle_set(input_data)
-            elif operation == "delete":
-                return await SkillEnvCrud._handle_delete(input_data)
-            elif operation == "clear":
-                return await SkillEnvCrud._handle_clear(input_data)
-            else:
+            handler = _OPERATIONS.get(operation)
+            if handler is None:
                 return [
                     types.TextContent(
                         type="text",
-                        text=f"Unknown operation: {operation}. Valid operations: read, set, delete, clear",
+                        text=f"Unknown operation: {operation}. Valid operations: {_VALID_OPERATIONS}",
                     )
                 ]
+            return await handler(input_data)
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
@@ -107,10 +112,12 @@ class SkillEnvCrud:
         if not keys:
             result = f"No environment variables set for skill '{input_data.skill_name}'"
         else:
-            result = f"Environment variables for skill '{input_data.skill_name}' ({len(keys)}):\n"
-            for key in keys:
-                result += f"  - {key}\n"
-            result += "\nNote: Values are hidden for security. Use read_env_file() to see the raw .env content."
+            key_lines = "".join(f"  - {key}\n" for key in keys)
+            result = (
+                f"Environment variables for skill '{input_data.skill_name}' ({len(keys)}):\n"
+                f"{key_lines}"
+                "\nNote: Values are hidden for security. Use read_env_file() to see the raw .env content."
+            )
 
         return [types.TextContent(type="text", text=result)]
 
@@ -175,3 +182,14 @@ class SkillEnvCrud:
                 text=f"Successfully cleared all environment variables for skill '{input_data.skill_name}'",
             )
         ]
+
+
+# Operation name -> handler
+_OPERATIONS: Dict[str, Callable[[SkillEnvCrudInput], Awaitable[list[types.TextContent]]]] = {
+    "read": SkillEnvCrud._handle_read,
+    "set": SkillEnvCrud._handle_set,
+    "delete": SkillEnvCrud._handle_delete,
+    "clear": SkillEnvCrud._handle_clear,
+}
+
+_VALID_OPERATIONS = ", ".join(_OPERATIONS)
@@ -1,21 +1,16 @@
 """Unified file CRUD tool for MCP server."""
 
+import asyncio
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Tuple
+
 from mcp import types
 
+from skill_mcp.core.config import SKILLS_DIR
 from skill_mcp.models_crud import SkillFilesCrudInput
 from skill_mcp.services.file_service import FileService
 
-
-class SkillFilesCrud:
-    """Unified tool for skill file CRUD operations."""
-
-    @staticmethod
-    def get_tool_definition() -> list[types.Tool]:
-        """Get tool definition."""
-        return [
-            types.Tool(
-                name="skill_files_crud",
-                description="""Unified CRUD tool for skill file operations. Supports both single and bulk operations.
+_SKILL_FILES_CRUD_DESCRIPTION = """Unified CRUD tool for skill file operations. Supports both single and bulk operations.
 
 IMPORTANT PATH NOTES:
 - All file paths are RELATIVE to the skill directory (e.g., 'main.py', 'scripts/utils.py')
@@ -73,10 +68,28 @@ IMPORTANT PATH NOTES:
     {"path": "file2.py", "content": "new content 2"}
   ]
 }
-```""",
-                inputSchema=SkillFilesCrudInput.model_json_schema(),
-            )
-        ]
+```"""
+
+
+@lru_cache(maxsize=1)
+def _tool_definitions() -> Tuple[types.Tool, ...]:
+    """Build the skill_files_crud tool definition."""
+    return (
+        types.Tool(
+            name="skill_files_crud",
+            description=_SKILL_FILES_CRUD_DESCRIPTION,
+            inputSchema=SkillFilesCrudInput.model_json_schema(),
+        ),
+    )
+
+
+class SkillFilesCrud:
+    """Unified tool for skill file CRUD operations."""
+
+    @staticmethod
+    def get_tool_definition() -> list[types.Tool]:
+        """Get tool definition."""
+        return list(_tool_definitions())
 
     @staticmethod
     async def skill_files_crud(input_data: SkillFilesCrudInput) -> list[types.TextContent]:
@@ -84,21 +97,15 @@ IMPORTANT PATH NOTES:
         operation = input_data.operation
 
         try:
-            if operation == "read":
-                return await SkillFilesCrud._handle_read(input_data)
-            elif operation == "create":
-                return await SkillFilesCrud._handle_create(input_data)
-            elif operation == "update":
-                return await SkillFilesCrud._handle_update(input_data)
-            elif operation == "delete":
-                return await SkillFilesCrud._handle_delete(input_data)
-            else:
+            handler = _OPERATIONS.get(operation)
+            if handler is None:
                 return [
                     types.TextContent(
                         type="text",
-                        text=f"Unknown operation: {operation}. Valid operations: read, create, update, delete",
+                        text=f"Unknown operation: {operation}. Valid operations: {_VALID_OPERATIONS}",
                     )
                 ]
+            return await handler(input_data)
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
@@ -118,19 +125,25 @@ IMPORTANT PATH NOTES:
             results = []
             errors = []
 
-            for file_path in input_data.file_paths:
-                try:
-                    content = FileService.read_file(input_data.skill_name, file_path)
-                    namespaced_path = f"{input_data.skill_name}:{file_path}"
+            # Read the files concurrently
+            contents = await asyncio.gather(
+                *(
+                    asyncio.to_thread(FileService.read_file, input_data.skill_name, file_path)
+                    for file_path in input_data.file_paths
+                ),
+                return_exceptions=True,
+            )
+
+            for file_path, content in zip(input_data.file_paths, contents):
+                namespaced_path = f"{input_data.skill_name}:{file_path}"
+                if isinstance(content, BaseException):
+                    errors.append(f"Error reading '{namespaced_path}': {str(content)}")
+                else:
                     results.append(f"=== {namespaced_path} ===\n{content}")
-                except Exception as e:
-                    namespaced_path = f"{input_data.skill_name}:{file_path}"
-                    errors.append(f"Error reading '{namespaced_path}': {str(e)}")
 
-            # Combine results
-            output = "\n\n".join(results)
             if errors:
-                output += "\n\n" + "\n".join(errors)
+                results.append("\n".join(errors))
+            output = "\n\n".join(results)
 
             return [types.TextContent(type="text", text=output)]
 
@@ -182,8 +195,6 @@ IMPORTANT PATH NOTES:
             except Exception as e:
                 # Rollback on error if atomic mode
                 if input_data.atomic:
-                    from skill_mcp.core.config import SKILLS_DIR
-
                     skill_dir = SKILLS_DIR / input_data.skill_name
                     for created_path in created_files:
                         try:
@@ -268,3 +279,14 @@ IMPORTANT PATH NOTES:
         return [
             types.TextContent(type="text", text=f"Successfully deleted file '{namespaced_path}'")
         ]
+
+
+# Operation name -> handler
+_OPERATIONS: Dict[str, Callable[[SkillFilesCrudInput], Awaitable[list[types.TextContent]]]] = {
+    "read": SkillFilesCrud._handle_read,
+    "create": SkillFilesCrud._handle_create,
+    "update": SkillFilesCrud._handle_update,
+    "delete": SkillFilesCrud._handle_delete,
+}
+
+_VALID_OPERATIONS = ", ".join(_OPERATIONS)
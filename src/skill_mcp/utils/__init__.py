@@ -6,11 +6,13 @@ from skill_mcp.utils.yaml_parser import (
     get_skill_description,
     get_skill_name,
     parse_yaml_frontmatter,
+    read_yaml_frontmatter,
 )
 
 __all__ = [
     "validate_path",
     "parse_yaml_frontmatter",
+    "read_yaml_frontmatter",
     "get_skill_description",
     "get_skill_name",
     "is_executable_script",
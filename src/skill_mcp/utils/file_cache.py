@@ -0,0 +1,55 @@
+"""Caching of per-file parse results keyed on the file's stat signature."""
+
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Callable, List, TypeVar
+
+T = TypeVar("T")
+
+# cache_clear of every stat_cached function, for invalidate_file_caches()
+_CACHE_CLEARERS: List[Callable[[], None]] = []
+
+
+def stat_cached(maxsize: int) -> Callable[[Callable[[Path], T]], Callable[[Path], T]]:
+    """
+    Memoize a function of a file path on the file's (path, mtime_ns, size).
+
+    The wrapped function runs again only when the file's stat signature
+    changes or after invalidate_file_caches(). It should return an
+    immutable value, since cached results are shared between callers.
+
+    Args:
+        maxsize: Maximum number of files to keep results for
+
+    Returns:
+        Decorator for a function taking a Path. The decorated function
+        raises OSError if the file cannot be stat'ed.
+    """
+
+    def decorator(func: Callable[[Path], T]) -> Callable[[Path], T]:
+        @lru_cache(maxsize=maxsize)
+        def cached(path: str, mtime_ns: int, size: int) -> T:
+            return func(Path(path))
+
+        _CACHE_CLEARERS.append(cached.cache_clear)
+
+        @wraps(func)
+        def wrapper(path: Path) -> T:
+            stat = path.stat()
+            return cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_file_caches() -> None:
+    """
+    Drop all results cached by stat_cached functions.
+
+    Call this after writing skill files. A rewrite that keeps the same size
+    within the filesystem's timestamp granularity leaves the stat signature
+    unchanged, so the cache cannot notice it on its own.
+    """
+    for clear in _CACHE_CLEARERS:
+        clear()
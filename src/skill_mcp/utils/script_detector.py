@@ -1,7 +1,46 @@
 """Script detection and analysis utilities."""
 
+import os
 from pathlib import Path
 
+from skill_mcp.utils.file_cache import stat_cached
+
+# Opening markers of PEP 723 inline metadata blocks that uv understands
+PEP723_SCRIPT_MARKER = "# /// script"
+PEP723_PYPROJECT_MARKER = "# /// pyproject"
+
+# File extension -> file type reported by get_file_type
+_FILE_TYPES = {
+    ".py": "python",
+    ".sh": "shell",
+    ".bash": "shell",
+    ".zsh": "shell",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".md": "markdown",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".txt": "text",
+    ".env": "env",
+}
+
+# File types that are run without needing a shebang or executable bit
+_EXECUTABLE_TYPES = frozenset(("python", "shell", "javascript"))
+
+
+def has_pep723_marker(content: str) -> bool:
+    """
+    Check if source text contains a PEP 723 inline metadata block marker.
+
+    Args:
+        content: Script source text
+
+    Returns:
+        True if uv would find inline metadata in the text
+    """
+    return PEP723_SCRIPT_MARKER in content or PEP723_PYPROJECT_MARKER in content
+
 
 def get_file_type(file_path: Path) -> str:
     """
@@ -13,24 +52,7 @@ def get_file_type(file_path: Path) -> str:
     Returns:
         File type string (e.g., 'python', 'shell', 'markdown', 'unknown')
     """
-    suffix = file_path.suffix.lower()
-
-    type_map = {
-        ".py": "python",
-        ".sh": "shell",
-        ".bash": "shell",
-        ".zsh": "shell",
-        ".js": "javascript",
-        ".mjs": "javascript",
-        ".md": "markdown",
-        ".json": "json",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-        ".txt": "text",
-        ".env": "env",
-    }
-
-    return type_map.get(suffix, "unknown")
+    return _FILE_TYPES.get(file_path.suffix.lower(), "unknown")
 
 
 def is_executable_script(file_path: Path) -> bool:
@@ -51,7 +73,7 @@ def is_executable_script(file_path: Path) -> bool:
     file_type = get_file_type(file_path)
 
     # Known executable types
-    if file_type in ("python", "shell", "javascript"):
+    if file_type in _EXECUTABLE_TYPES:
         return True
 
     # Check for shebang
@@ -65,8 +87,6 @@ def is_executable_script(file_path: Path) -> bool:
 
     # Check executable permission on Unix-like systems
     try:
-        import os
-
         return os.access(file_path, os.X_OK)
     except Exception:
         pass
@@ -93,12 +113,17 @@ def has_uv_dependencies(script_path: Path) -> bool:
         return False
 
     try:
-        content = script_path.read_text(encoding="utf-8", errors="ignore")
-        return "# /// script" in content or "# /// pyproject" in content
+        return _has_uv_metadata(script_path)
     except Exception:
         return False
 
 
+@stat_cached(maxsize=256)
+def _has_uv_metadata(script_path: Path) -> bool:
+    """Scan a script for PEP 723 markers."""
+    return has_pep723_marker(script_path.read_text(encoding="utf-8", errors="ignore"))
+
+
 def has_npm_dependencies(script_path: Path) -> bool:
     """
     Check if JavaScript script has package.json in its directory.
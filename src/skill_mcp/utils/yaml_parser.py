@@ -1,9 +1,14 @@
 """YAML frontmatter parsing utilities."""
 
-from typing import Any, Dict, Optional
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import yaml
 
+# A line containing only the closing --- marker (surrounding whitespace allowed)
+_FRONTMATTER_END_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+
 
 def parse_yaml_frontmatter(content: str) -> Optional[Dict[str, Any]]:
     """
@@ -24,31 +29,57 @@ def parse_yaml_frontmatter(content: str) -> Optional[Dict[str, Any]]:
     if not content.startswith("---"):
         return None
 
-    try:
-        # Find the closing --- marker
-        lines = content.split("\n")
-        if len(lines) < 2:
-            return None
+    # Frontmatter starts on the line after the opening marker
+    start = content.find("\n") + 1
+    if not start:
+        return None
 
-        # Find end of frontmatter
-        end_index = None
-        for i in range(1, len(lines)):
-            if lines[i].strip() == "---":
-                end_index = i
-                break
+    # No closing marker candidate means no frontmatter
+    marker = content.find("---", start)
+    if marker < 0:
+        return None
+    line_start = content.rfind("\n", start, marker) + 1 or start
 
-        if end_index is None:
-            return None
+    # Find the closing --- marker
+    end_match = _FRONTMATTER_END_RE.search(content, line_start)
+    if end_match is None:
+        return None
 
-        # Extract and parse YAML
-        frontmatter_content = "\n".join(lines[1:end_index])
-        data = yaml.safe_load(frontmatter_content)
+    try:
+        data = yaml.safe_load(content[start : end_match.start()])
 
         return data if isinstance(data, dict) else None
     except yaml.YAMLError:
         return None
 
 
+def read_yaml_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read and parse YAML frontmatter from a markdown file.
+
+    Only the lines up to the closing --- marker are read, so the body of
+    the document is never loaded.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        Dictionary with parsed YAML, or None if no frontmatter found
+    """
+    with open(file_path) as f:
+        first_line = f.readline()
+        if not first_line.startswith("---"):
+            return None
+
+        lines: List[str] = [first_line]
+        for line in f:
+            lines.append(line)
+            if line.strip() == "---":
+                return parse_yaml_frontmatter("".join(lines))
+
+    return None
+
+
 def get_skill_description(metadata: Optional[Dict[str, Any]]) -> str:
     """
     Extract description from skill metadata.
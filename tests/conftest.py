@@ -15,12 +15,16 @@ def temp_skills_dir(tmp_path, monkeypatch):
     import skill_mcp.services.file_service as file_mod
     import skill_mcp.services.script_service as script_mod
     import skill_mcp.services.skill_service as skill_mod
+    import skill_mcp.tools.skill_crud as skill_crud_mod
+    import skill_mcp.tools.skill_files_crud as skill_files_crud_mod
 
     monkeypatch.setattr(config_mod, "SKILLS_DIR", skills_dir)
     monkeypatch.setattr(file_mod, "SKILLS_DIR", skills_dir)
     monkeypatch.setattr(skill_mod, "SKILLS_DIR", skills_dir)
     monkeypatch.setattr(script_mod, "SKILLS_DIR", skills_dir)
     monkeypatch.setattr(env_mod, "SKILLS_DIR", skills_dir)
+    monkeypatch.setattr(skill_crud_mod, "SKILLS_DIR", skills_dir)
+    monkeypatch.setattr(skill_files_crud_mod, "SKILLS_DIR", skills_dir)
 
     return skills_dir
 
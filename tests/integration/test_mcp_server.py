@@ -188,3 +188,25 @@ async def test_server_unknown_tool():
     result = await call_tool("unknown_tool", {})
 
     assert "Unknown tool" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_server_every_listed_tool_has_handler():
+    """Test each tool advertised by list_tools is dispatched by call_tool."""
+    from skill_mcp.server import _TOOL_HANDLERS, list_tools
+
+    tools = await list_tools()
+
+    assert {t.name for t in tools} == set(_TOOL_HANDLERS)
+
+
+@pytest.mark.asyncio
+async def test_server_list_tools_returns_fresh_list():
+    """Test callers can modify the listed tools without affecting later calls."""
+    from skill_mcp.server import list_tools
+
+    tools = await list_tools()
+    expected = [t.name for t in tools]
+    tools.clear()
+
+    assert [t.name for t in await list_tools()] == expected
@@ -67,3 +67,33 @@ def test_get_env_keys(skill_with_env, temp_skills_dir):
         assert "API_KEY" in keys
         assert "DATABASE_URL" in keys
         assert len(keys) == 2
+
+
+def test_load_skill_env_sees_same_size_rewrites(sample_skill, temp_skills_dir):
+    """Test cached .env parses are dropped when the service rewrites the file."""
+    with patch("skill_mcp.services.env_service.SKILLS_DIR", temp_skills_dir):
+        EnvironmentService.update_env_file("test-skill", "KEY=a")
+        assert EnvironmentService.load_skill_env("test-skill") == {"KEY": "a"}
+
+        EnvironmentService.update_env_file("test-skill", "KEY=b")
+        env = EnvironmentService.load_skill_env("test-skill")
+        assert env == {"KEY": "b"}
+
+        # Callers get their own dict, not the cached entry
+        env["OTHER"] = "x"
+        assert EnvironmentService.load_skill_env("test-skill") == {"KEY": "b"}
+
+
+def test_load_skill_env_interpolates_current_environ(sample_skill, temp_skills_dir, monkeypatch):
+    """Test ${VAR} references follow os.environ between loads of an unchanged file."""
+    (sample_skill / ".env").write_text("URL=${SKILL_MCP_TEST_HOST}/api\nPLAIN=value\n")
+
+    with patch("skill_mcp.services.env_service.SKILLS_DIR", temp_skills_dir):
+        monkeypatch.setenv("SKILL_MCP_TEST_HOST", "a")
+        assert EnvironmentService.load_skill_env("test-skill") == {
+            "URL": "a/api",
+            "PLAIN": "value",
+        }
+
+        monkeypatch.setenv("SKILL_MCP_TEST_HOST", "b")
+        assert EnvironmentService.load_skill_env("test-skill")["URL"] == "b/api"
@@ -0,0 +1,59 @@
+"""Tests for stat-signature file caching."""
+
+import os
+
+import pytest
+
+from skill_mcp.utils.file_cache import invalidate_file_caches, stat_cached
+
+
+def test_stat_cached_rereads_only_on_change(tmp_path):
+    """Test results are reused until the file's size or mtime changes."""
+    calls = []
+
+    @stat_cached(maxsize=8)
+    def read(path):
+        calls.append(path)
+        return path.read_text()
+
+    target = tmp_path / "data.txt"
+    target.write_text("one")
+
+    assert read(target) == "one"
+    assert read(target) == "one"
+    assert len(calls) == 1
+
+    target.write_text("three")
+    assert read(target) == "three"
+    assert len(calls) == 2
+
+
+def test_invalidate_file_caches_drops_same_signature_results(tmp_path):
+    """Test invalidation catches rewrites that keep the same stat signature."""
+
+    @stat_cached(maxsize=8)
+    def read(path):
+        return path.read_text()
+
+    target = tmp_path / "data.txt"
+    target.write_text("a")
+    signature = target.stat().st_mtime_ns
+    assert read(target) == "a"
+
+    target.write_text("b")
+    os.utime(target, ns=(signature, signature))
+    assert read(target) == "a"
+
+    invalidate_file_caches()
+    assert read(target) == "b"
+
+
+def test_stat_cached_missing_file(tmp_path):
+    """Test a missing file raises instead of caching a result."""
+
+    @stat_cached(maxsize=8)
+    def read(path):
+        return path.read_text()
+
+    with pytest.raises(FileNotFoundError):
+        read(tmp_path / "missing.txt")
@@ -1,5 +1,8 @@
 """Tests for file service."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 
 from skill_mcp.core.exceptions import FileNotFoundError, ProtectedFileError, SkillNotFoundError
@@ -18,6 +21,13 @@ def test_read_nonexistent_file(sample_skill, temp_skills_dir):
         FileService.read_file("test-skill", "nonexistent.txt")
 
 
+def test_read_directory_is_not_a_file(sample_skill, temp_skills_dir):
+    """Test reading a directory path is rejected."""
+    with patch("skill_mcp.utils.path_utils.SKILLS_DIR", temp_skills_dir):
+        with pytest.raises(FileNotFoundError, match="is not a file"):
+            FileService.read_file("test-skill", "scripts")
+
+
 def test_delete_nonexistent_file(sample_skill, temp_skills_dir):
     """Test deleting nonexistent file."""
     with pytest.raises(FileNotFoundError):
@@ -31,7 +41,53 @@ def test_list_skill_files_has_files(sample_skill, temp_skills_dir):
     assert any("SKILL.md" in f["path"] for f in files)
 
 
+def test_iter_skill_files_matches_sorted_walk(sample_skill, temp_skills_dir):
+    """Test iterating files yields every file in sorted path order."""
+    (sample_skill / "scripts.txt").write_text("notes")
+    (sample_skill / "scripts" / "nested").mkdir()
+    (sample_skill / "scripts" / "nested" / "deep.py").write_text("pass")
+
+    paths = [f["path"] for f in FileService.iter_skill_files("test-skill")]
+    expected = [
+        str(p.relative_to(sample_skill)) for p in sorted(sample_skill.rglob("*")) if p.is_file()
+    ]
+    assert paths == expected
+
+
+def test_iter_skill_files_nonexistent_skill(temp_skills_dir):
+    """Test iterating files for nonexistent skill fails before iteration."""
+    with pytest.raises(SkillNotFoundError):
+        FileService.iter_skill_files("nonexistent-skill")
+
+
 def test_delete_protected_skill_md(sample_skill, temp_skills_dir):
     """Test that SKILL.md cannot be deleted."""
     with pytest.raises(ProtectedFileError, match="Cannot delete 'SKILL.md'"):
         FileService.delete_file("test-skill", "SKILL.md")
+
+
+def test_update_file_when_skill_is_not_a_directory(temp_skills_dir):
+    """Test file operations reject a skill name that points at a plain file."""
+    (temp_skills_dir / "not-a-skill").write_text("plain file")
+
+    with pytest.raises(SkillNotFoundError, match="is not a directory"):
+        FileService.update_file("not-a-skill", "main.py", "print('x')")
+
+
+def test_update_file_invalidates_cached_parses(sample_skill, temp_skills_dir):
+    """Test a .env rewritten through FileService is re-parsed even if its stat is unchanged."""
+    from skill_mcp.services.env_service import EnvironmentService
+
+    env_file = sample_skill / ".env"
+    env_file.write_text("KEY=a")
+    signature = env_file.stat().st_mtime_ns
+
+    with patch("skill_mcp.services.env_service.SKILLS_DIR", temp_skills_dir):
+        with patch("skill_mcp.utils.path_utils.SKILLS_DIR", temp_skills_dir):
+            assert EnvironmentService.load_skill_env("test-skill") == {"KEY": "a"}
+
+            FileService.update_file("test-skill", ".env", "KEY=b")
+            # Same size and mtime, as a rewrite within the timestamp granularity would leave
+            os.utime(env_file, ns=(signature, signature))
+
+            assert EnvironmentService.load_skill_env("test-skill") == {"KEY": "b"}
@@ -172,6 +172,31 @@ def test_has_uv_dependencies_file_not_found(tmp_path):
     assert has_uv_dependencies(script) is False
 
 
+def test_has_uv_dependencies_reflects_file_changes(tmp_path):
+    """Test has_uv_dependencies picks up edits to a previously checked script."""
+    import os
+
+    from skill_mcp.utils.script_detector import has_uv_dependencies
+
+    script = tmp_path / "script.py"
+    script.write_text("print('hello')")
+    assert has_uv_dependencies(script) is False
+
+    script.write_text('# /// script\n# dependencies = ["requests"]\n# ///\nprint("hello")')
+    stat = script.stat()
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert has_uv_dependencies(script) is True
+
+
+def test_has_pep723_marker():
+    """Test marker detection on source text."""
+    from skill_mcp.utils.script_detector import has_pep723_marker
+
+    assert has_pep723_marker("# /// script\n# ///\n") is True
+    assert has_pep723_marker("# /// pyproject\n# ///\n") is True
+    assert has_pep723_marker("print('hello')") is False
+
+
 def test_list_executable_scripts(tmp_path):
     """Test list_executable_scripts finds executable scripts."""
     from skill_mcp.utils.script_detector import list_executable_scripts
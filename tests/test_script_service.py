@@ -1,5 +1,7 @@
 """Tests for script service."""
 
+import asyncio
+import os
 from unittest.mock import patch
 
 import pytest
@@ -10,6 +12,7 @@ from skill_mcp.services.script_service import (
     ScriptService,
     extract_pep723_dependencies,
     merge_dependencies,
+    read_pep723_dependencies,
 )
 
 
@@ -57,10 +60,24 @@ async def test_run_script_directory_as_file(sample_skill, temp_skills_dir):
     """Test running a directory as a file."""
     with patch("skill_mcp.services.script_service.SKILLS_DIR", temp_skills_dir):
         with patch("skill_mcp.utils.path_utils.SKILLS_DIR", temp_skills_dir):
-            with pytest.raises(ScriptExecutionError):
+            with pytest.raises(ScriptExecutionError, match="is not a file"):
                 await ScriptService.run_script("test-skill", "scripts")
 
 
+@pytest.mark.asyncio
+async def test_run_script_sees_skill_env(skill_with_env, temp_skills_dir):
+    """Test run_script passes the skill's .env variables to the script."""
+    (skill_with_env / "show_env.py").write_text("import os\nprint(os.environ['API_KEY'])\n")
+
+    with patch("skill_mcp.services.script_service.SKILLS_DIR", temp_skills_dir):
+        with patch("skill_mcp.services.env_service.SKILLS_DIR", temp_skills_dir):
+            with patch("skill_mcp.utils.path_utils.SKILLS_DIR", temp_skills_dir):
+                result = await ScriptService.run_script("test-skill", "show_env.py")
+
+    assert result.exit_code == 0
+    assert result.stdout.strip() == "test-key"
+
+
 @pytest.mark.asyncio
 async def test_script_result_with_truncated_output():
     """Test ScriptResult handles truncated output."""
@@ -123,6 +140,20 @@ import os
     assert deps == []
 
 
+def test_read_pep723_dependencies_caches_until_file_changes(tmp_path):
+    """Test reading dependencies from a file is cached by its stat signature."""
+    lib_file = tmp_path / "lib.py"
+    lib_file.write_text('# /// script\n# dependencies = ["requests"]\n# ///\n')
+
+    assert read_pep723_dependencies(lib_file) == ["requests"]
+    with patch("pathlib.Path.read_text") as mock_read:
+        assert read_pep723_dependencies(lib_file) == ["requests"]
+        mock_read.assert_not_called()
+
+    lib_file.write_text('# /// script\n# dependencies = ["requests", "rich"]\n# ///\n')
+    assert read_pep723_dependencies(lib_file) == ["requests", "rich"]
+
+
 def test_merge_dependencies_creates_new_block():
     """Test merging dependencies creates PEP 723 block when none exists."""
     code = """from utils import calculate
@@ -172,6 +203,30 @@ print("test")
     assert "requests>=2.30.0" not in merged
 
 
+def test_merge_dependencies_deduplicates_by_package_name():
+    """Test deduplication ignores extras and other specifier operators."""
+    code = """# /// script
+# dependencies = [
+#   "requests[socks]~=2.30",
+# ]
+# ///
+"""
+    merged = merge_dependencies(code, ["requests>=2.31.0"])
+
+    assert extract_pep723_dependencies(merged) == ["requests>=2.31.0"]
+
+
+def test_merge_dependencies_already_declared_returns_code_unchanged():
+    """Test merging deps the code already declares leaves the code untouched."""
+    code = """# /// script
+# dependencies = ["requests>=2.31.0", "rich"]
+# ///
+
+print("test")
+"""
+    assert merge_dependencies(code, ["rich", "requests>=2.31.0"]) is code
+
+
 def test_merge_dependencies_empty_list():
     """Test merging with empty dependency list returns original code."""
     code = """print("test")"""
@@ -284,6 +339,78 @@ async def test_execute_python_code_with_custom_timeout(tmp_path):
         assert "done" in result.stdout
 
 
+@pytest.mark.asyncio
+async def test_execute_python_code_runs_from_file(tmp_path):
+    """Test code runs from a real file so __file__ and traceback source lines work."""
+    code = "print(__file__)\nraise ValueError('boom')"
+
+    with patch("skill_mcp.services.script_service.SKILLS_DIR", tmp_path):
+        result = await ScriptService.execute_python_code(code)
+
+    assert result.exit_code != 0
+    assert result.stdout.strip().endswith(".py")
+    assert "raise ValueError('boom')" in result.stderr
+
+
+@pytest.mark.asyncio
+async def test_execute_python_code_caps_output(tmp_path):
+    """Test output beyond MAX_OUTPUT_SIZE is truncated while it is being read."""
+    code = "import sys\nsys.stdout.write('x' * 50000)\nsys.stderr.write('e' * 10)"
+
+    with patch("skill_mcp.services.script_service.SKILLS_DIR", tmp_path):
+        with patch("skill_mcp.services.script_service.MAX_OUTPUT_SIZE", 1000):
+            result = await ScriptService.execute_python_code(code)
+
+    assert result.exit_code == 0
+    assert result.stdout == "x" * 1000 + "\n... (output truncated)"
+    assert result.stderr == "e" * 10
+
+
+@pytest.mark.asyncio
+async def test_execute_python_code_runs_concurrently(tmp_path):
+    """Test executions overlap: each child only finishes once the other has started."""
+
+    def handshake(mine: str, theirs: str) -> str:
+        return (
+            "import pathlib, time\n"
+            f"pathlib.Path({str(tmp_path / mine)!r}).touch()\n"
+            f"other = pathlib.Path({str(tmp_path / theirs)!r})\n"
+            "deadline = time.monotonic() + 20\n"
+            "while not other.exists() and time.monotonic() < deadline:\n"
+            "    time.sleep(0.01)\n"
+            "print('met' if other.exists() else 'alone')\n"
+        )
+
+    with patch("skill_mcp.services.script_service.SKILLS_DIR", tmp_path):
+        results = await asyncio.gather(
+            ScriptService.execute_python_code(handshake("a", "b")),
+            ScriptService.execute_python_code(handshake("b", "a")),
+        )
+
+    assert [r.stdout.strip() for r in results] == ["met", "met"]
+
+
+@pytest.mark.asyncio
+async def test_execute_python_code_cancel_kills_child(tmp_path):
+    """Test cancelling an execution kills the child process instead of leaving it running."""
+    pid_file = tmp_path / "pid"
+    code = f"import os, pathlib, time\npathlib.Path({str(pid_file)!r}).write_text(str(os.getpid()))\ntime.sleep(60)"
+
+    with patch("skill_mcp.services.script_service.SKILLS_DIR", tmp_path):
+        task = asyncio.create_task(ScriptService.execute_python_code(code, timeout=120))
+        while not (pid_file.exists() and pid_file.read_text()):
+            assert not task.done()
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # The child was killed and reaped before the cancellation propagated
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
+
+
 @pytest.mark.asyncio
 async def test_execute_python_code_timeout_error_message(tmp_path):
     """Test execute_python_code timeout error includes correct timeout value."""
@@ -386,6 +513,26 @@ print(f"SHARED: {os.environ.get('SHARED', 'not-found')}")
             assert "SHARED: from_skill2" in result.stdout
 
 
+@pytest.mark.asyncio
+async def test_execute_python_code_sees_current_server_env(tmp_path, monkeypatch):
+    """Test child processes see the server's environment as it is at call time."""
+    monkeypatch.setenv("SKILL_MCP_TEST_BASE_VAR", "from-server")
+    code = "import os\nprint(os.environ.get('SKILL_MCP_TEST_BASE_VAR'))"
+
+    with patch("skill_mcp.services.script_service.SKILLS_DIR", tmp_path):
+        result = await ScriptService.execute_python_code(code)
+
+    assert result.stdout.strip() == "from-server"
+
+
+@pytest.mark.asyncio
+async def test_execute_python_code_rejects_reference_without_namespace(tmp_path):
+    """Test skill references must use the skill_name:path format."""
+    with patch("skill_mcp.services.script_service.SKILLS_DIR", tmp_path):
+        with pytest.raises(ScriptExecutionError, match="Invalid skill reference format"):
+            await ScriptService.execute_python_code("print('x')", skill_references=["utils.py"])
+
+
 @pytest.mark.asyncio
 async def test_execute_python_code_handles_missing_env_file(tmp_path):
     """Test execute_python_code works even if referenced skill has no .env file."""
@@ -407,3 +554,26 @@ print(f"Result: {result}")
 
         assert result.exit_code == 0
         assert "Result: 30" in result.stdout
+
+
+@pytest.mark.asyncio
+async def test_execute_python_code_aggregates_deps_in_reference_order(tmp_path):
+    """Test dependencies from referenced files are aggregated in order without repeats."""
+    skill_dir = tmp_path / "libs"
+    skill_dir.mkdir()
+    (skill_dir / "a.py").write_text('# /// script\n# dependencies = ["requests"]\n# ///\n')
+    (skill_dir / "b.py").write_text('# /// script\n# dependencies = ["rich"]\n# ///\n')
+    (skill_dir / "c.py").write_text('# /// script\n# dependencies = ["requests"]\n# ///\n')
+
+    with patch("skill_mcp.services.script_service.SKILLS_DIR", tmp_path):
+        with patch(
+            "skill_mcp.services.script_service.merge_dependencies",
+            side_effect=lambda code, deps: code,
+        ) as mock_merge:
+            result = await ScriptService.execute_python_code(
+                "print('ok')",
+                skill_references=["libs:a.py", "libs:missing.py", "libs:b.py", "libs:c.py"],
+            )
+
+    assert result.exit_code == 0
+    mock_merge.assert_called_once_with("print('ok')", ["requests", "rich"])
@@ -3,8 +3,9 @@
 import pytest
 
 from skill_mcp.core.config import SKILLS_DIR
+from skill_mcp.models import SkillSummary
 from skill_mcp.models_crud import SkillCrudInput
-from skill_mcp.tools.skill_crud import SkillCrud
+from skill_mcp.tools.skill_crud import SkillCrud, _filter_skills, _render_skills
 
 
 @pytest.fixture
@@ -289,6 +290,21 @@ class TestSkillCrudValidate:
         assert f"Validation for skill '{test_skill_name}'" in result[0].text
         assert "✓ Valid" in result[0].text or "✗ Invalid" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_validate_reports_errors(self, temp_skills_dir):
+        """Test validating a skill without SKILL.md lists the error."""
+        (temp_skills_dir / "broken-skill").mkdir()
+
+        input_data = SkillCrudInput(operation="validate", skill_name="broken-skill")
+        result = await SkillCrud.skill_crud(input_data)
+
+        assert result[0].text == (
+            "Validation for skill 'broken-skill':\n"
+            "Status: ✗ Invalid\n\n"
+            "Errors:\n"
+            "  - SKILL.md file is missing\n"
+        )
+
     @pytest.mark.asyncio
     async def test_validate_without_skill_name(self):
         """Test validate fails without skill_name."""
@@ -431,6 +447,39 @@ class TestSkillCrudSearch:
         assert "No skills found" in output or "0 skill" in output
 
 
+class TestFilterSkills:
+    """Tests for the shared skill search filter."""
+
+    def test_filter_matches_substring_and_regex(self):
+        """Test case-insensitive substring matches plus regex matches on names."""
+        skills = [
+            SkillSummary(name="weather-skill", description="Forecasts", has_skill_md=True),
+            SkillSummary(name="calculator", description="Weather-proof math", has_skill_md=True),
+            SkillSummary(name="notes", description="", has_skill_md=False),
+        ]
+
+        assert [s.name for s in _filter_skills(skills, "WEATHER")] == [
+            "weather-skill",
+            "calculator",
+        ]
+        assert [s.name for s in _filter_skills(skills, "^n.*s$")] == ["notes"]
+
+
+class TestRenderSkills:
+    """Tests for the shared skill listing renderer."""
+
+    def test_render_skills(self):
+        """Test entries show status, name and description when present."""
+        skills = [
+            SkillSummary(name="weather-skill", description="Forecasts", has_skill_md=True),
+            SkillSummary(name="notes", description="", has_skill_md=False),
+        ]
+
+        assert _render_skills("Found 2 skill(s):\n\n", skills) == (
+            "Found 2 skill(s):\n\n✓ weather-skill\n   Description: Forecasts\n\n✗ notes\n\n"
+        )
+
+
 class TestSkillCrudInvalidOperation:
     """Tests for invalid operations."""
 
@@ -443,3 +492,19 @@ class TestSkillCrudInvalidOperation:
         assert len(result) == 1
         assert "Unknown operation" in result[0].text
         assert "invalid_op" in result[0].text
+        assert result[0].text.endswith(
+            "Valid operations: create, list, search, get, validate, delete, list_templates"
+        )
+
+
+class TestSkillCrudToolDefinition:
+    """Tests for the tool definition."""
+
+    def test_tool_definition_is_built_once(self):
+        """Test repeated calls share the tool but return independent lists."""
+        tools = SkillCrud.get_tool_definition()
+        again = SkillCrud.get_tool_definition()
+
+        assert tools is not again
+        assert tools[0] is again[0]
+        assert [tool.name for tool in tools] == ["skill_crud"]
@@ -214,6 +214,7 @@ class TestSkillFilesCrudRead:
 
         # Should show error for missing file
         assert "Error" in output or "does not exist" in output
+        assert output.startswith(f"=== {setup_test_skill}:exists.py ===\n# Exists\n\nError reading")
 
     @pytest.mark.asyncio
     async def test_read_nonexistent_file(self, setup_test_skill):
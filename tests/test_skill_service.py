@@ -56,3 +56,32 @@ def test_get_nonexistent_skill(temp_skills_dir):
     with patch("skill_mcp.services.skill_service.SKILLS_DIR", temp_skills_dir):
         with pytest.raises(SkillNotFoundError):
             SkillService.get_skill_details("nonexistent")
+
+
+def test_list_skills_reuses_unchanged_descriptions(sample_skill, temp_skills_dir):
+    """Test listing skills does not re-read an unchanged SKILL.md."""
+    with patch("skill_mcp.services.skill_service.SKILLS_DIR", temp_skills_dir):
+        assert SkillService.list_skills()[0].description == "A test skill for unit testing"
+
+        with patch("skill_mcp.services.skill_service.read_yaml_frontmatter") as mock_read:
+            assert SkillService.list_skills()[0].description == "A test skill for unit testing"
+            mock_read.assert_not_called()
+
+        (sample_skill / "SKILL.md").write_text("---\ndescription: Updated\n---\n")
+        assert SkillService.list_skills()[0].description == "Updated"
+
+
+def test_list_skills_retries_unreadable_skill_md(sample_skill, temp_skills_dir):
+    """Test a failed SKILL.md read is not cached and is retried on the next listing."""
+    (sample_skill / "SKILL.md").write_text("---\ndescription: Retried\n---\n")
+
+    with patch("skill_mcp.services.skill_service.SKILLS_DIR", temp_skills_dir):
+        with patch(
+            "skill_mcp.services.skill_service.read_yaml_frontmatter",
+            side_effect=PermissionError("denied"),
+        ):
+            summary = SkillService.list_skills()[0]
+            assert summary.description == ""
+            assert summary.has_skill_md
+
+        assert SkillService.list_skills()[0].description == "Retried"
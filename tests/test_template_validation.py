@@ -3,7 +3,9 @@
 import pytest
 
 from skill_mcp.core.config import SKILLS_DIR
+from skill_mcp.core.exceptions import InvalidTemplateError
 from skill_mcp.models_crud import SkillCrudInput
+from skill_mcp.services.template_service import TemplateRegistry
 from skill_mcp.tools.skill_crud import SkillCrud
 
 
@@ -181,3 +183,19 @@ class TestTemplateDiscovery:
 
         # Should include descriptions
         assert "description" in text or ":" in result[0].text
+
+    def test_registry_list_is_read_only(self):
+        """Test the registry hands out a read-only view instead of a copy."""
+        templates = TemplateRegistry.list_templates()
+
+        assert templates is TemplateRegistry.list_templates()
+        assert set(templates) == set(TemplateRegistry.TEMPLATES)
+        with pytest.raises(TypeError):
+            templates["custom"] = templates["basic"]  # type: ignore[index]
+
+    def test_registry_invalid_template_lists_names(self):
+        """Test the invalid-template error names every available template."""
+        with pytest.raises(InvalidTemplateError) as exc_info:
+            TemplateRegistry.get_template("missing")
+
+        assert "basic, python, bash, nodejs" in str(exc_info.value)
@@ -4,6 +4,7 @@ from skill_mcp.utils.yaml_parser import (
     get_skill_description,
     get_skill_name,
     parse_yaml_frontmatter,
+    read_yaml_frontmatter,
 )
 
 
@@ -43,6 +44,50 @@ no closing marker"""
     assert result is None
 
 
+def test_parse_frontmatter_stops_at_first_closing_marker():
+    """Test parsing stops at the first closing marker, ignoring later rules."""
+    content = "---\r\nname: test-skill\r\n---  \r\n\n# Title\n\n---\n\nname: other\n"
+    result = parse_yaml_frontmatter(content)
+
+    assert result == {"name": "test-skill"}
+
+
+def test_parse_frontmatter_ignores_dashes_inside_values():
+    """Test a --- inside a value is not taken as the closing marker."""
+    content = "---\nname: test-skill\ndescription: before --- after\n---\n# Body\n"
+    result = parse_yaml_frontmatter(content)
+
+    assert result == {"name": "test-skill", "description": "before --- after"}
+
+
+def test_parse_empty_frontmatter():
+    """Test parsing frontmatter with no keys."""
+    result = parse_yaml_frontmatter("---\n---\n# Content")
+
+    assert result is None
+
+
+def test_read_yaml_frontmatter(tmp_path):
+    """Test reading frontmatter from a file."""
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text("---\nname: test-skill\ndescription: A test skill\n---\n\n# Body\n")
+
+    result = read_yaml_frontmatter(skill_md)
+
+    assert result == {"name": "test-skill", "description": "A test skill"}
+
+
+def test_read_yaml_frontmatter_missing(tmp_path):
+    """Test reading a file without frontmatter or without a closing marker."""
+    plain = tmp_path / "plain.md"
+    plain.write_text("# Title\n---\n")
+    unclosed = tmp_path / "unclosed.md"
+    unclosed.write_text("---\nname: test-skill\n")
+
+    assert read_yaml_frontmatter(plain) is None
+    assert read_yaml_frontmatter(unclosed) is None
+
+
 def test_get_skill_description():
     """Test extracting skill description."""
     metadata = {"name": "test", "description": "Test description"}